@@ -12,4 +12,16 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 GPT_MAX_TOKENS = 300  # Set to the desired max tokens for ChatGPT responses 100
 GPT_TEMPERATURE = 0.5  # Adjust temperature to control response creativity 0.3
 
-BASELINE_TOP_SNIPPETS = 5  # Number of snippets to include in the generated answer
\ No newline at end of file
+BASELINE_TOP_SNIPPETS = 5  # Number of snippets to include in the generated answer
+
+# Token budgets for the snippet block of the GPT prompt, per answer type. Snippets are single
+# sentences of roughly 30-45 tokens, and rank_snippet offers up to 30 of them (3 per top-10 article),
+# so these budgets keep about 5-12 of the highest-scoring snippets.
+PROMPT_TOKEN_BUDGETS = {
+    "summary": 500,
+    "factoid": 200,
+    "list": 350,
+    "yesno": 200,
+}
+
+EXACT_ANSWER_ENGINE = "gpt"  # "gpt" to ask GPT, "local" for batched SpaCy extraction without an LLM
@@ -24,6 +24,14 @@ def load_training_exact_answers(training_data_path):
         data = json.load(f)
     return {item["id"]: item["exact_answer"] for item in data["questions"] if item["type"] in ["factoid", "yesno", "list"]}
 
+def answer_to_text(answer):
+    """
+    Flattens a list answer (e.g. [['item1'], ['item2']]) into text so it can be scored with ROUGE/BERT.
+    """
+    if isinstance(answer, list):
+        return "; ".join(answer_to_text(item) for item in answer)
+    return answer
+
 def compute_rouge_scores(training_ideal_answer, generated_ideal_answer):
     scorer = rouge_scorer.RougeScorer(['rouge1', 'rouge2', 'rougeL'], use_stemmer=True)
     return scorer.score(training_ideal_answer, generated_ideal_answer)
@@ -51,7 +59,7 @@ def compute_bert_scores(training_ideal_answers, generated_ideal_answers):
     }
 
 def evaluate_generated_ideal_answers(generated_data, training_data_path):
-    generated_ideal_answers = {item["id"]: item["generated_answer"] for item in generated_data}
+    generated_ideal_answers = {item["id"]: answer_to_text(item["generated_answer"]) for item in generated_data}
     training_ideal_answers = load_training_ideal_answers(training_data_path)
     
     rouge_scores = []
@@ -95,21 +103,77 @@ def evaluate_generated_ideal_answers(generated_data, training_data_path):
         "average_bert": bert_score_avg
     }
 
+def normalize_exact_answer(answer):
+    """
+    Normalizes an exact answer item for comparison (case, surrounding whitespace and trailing period).
+    """
+    return str(answer).strip().strip('"\'').rstrip('.').strip().lower()
+
+def exact_answer_items(answer):
+    """
+    Returns the items of a generated list answer, accepting the dataset format ([['item1'], ['item2']]),
+    its JSON string form as produced by GPT, or a "; "-separated string.
+    """
+    if isinstance(answer, str):
+        try:
+            answer = json.loads(answer)
+        except ValueError:
+            return [item for item in answer.split(';') if item.strip()]
+    if not isinstance(answer, list):
+        return [answer]
+    items = []
+    for item in answer:
+        items.extend(exact_answer_items(item) if isinstance(item, list) else [item])
+    return items
+
 def evaluate_generated_exact_answers(generated_data, training_data_path):
-    generated_exact_answers = {item["id"]: item["generated_answer"] for item in generated_data}
+    """
+    Evaluates generated exact answers against the training data: accuracy for yes/no and factoid questions
+    (factoids match any synonym) and mean precision, recall and F1 over the items of list questions.
+    All comparisons are case-insensitive.
+    """
     training_exact_answers = load_training_exact_answers(training_data_path)
-    
-    numerator, denominator = 0, 0
 
-    for question_id, generated_exact_answer in generated_exact_answers.items():
-        training_exact_answer = training_exact_answers.get(question_id, "")[0]
-        
-        # ROUGE scores
-        if training_exact_answer == generated_exact_answer:
-            numerator += 1
-        denominator += 1
-    
-    if not denominator:
-        return 0
-    
-    return numerator/denominator
\ No newline at end of file
+    yesno_correct, yesno_total = 0, 0
+    factoid_correct, factoid_total = 0, 0
+    list_precisions, list_recalls, list_f1s = [], [], []
+
+    for item in generated_data:
+        question_id = item["id"]
+        if question_id not in training_exact_answers:
+            continue
+        training_exact_answer = training_exact_answers[question_id]
+        generated_exact_answer = item["generated_answer"]
+
+        if item["type"] == "yesno":
+            yesno_total += 1
+            yesno_correct += normalize_exact_answer(generated_exact_answer) == normalize_exact_answer(training_exact_answer)
+
+        elif item["type"] == "factoid":
+            # Factoid answers are stored as a list of synonyms
+            synonyms = set(normalize_exact_answer(synonym) for synonym in exact_answer_items(training_exact_answer))
+            factoid_total += 1
+            factoid_correct += normalize_exact_answer(generated_exact_answer) in synonyms
+
+        elif item["type"] == "list":
+            # List answers are stored as a list of items, each a list of synonyms
+            gold_items = [set(normalize_exact_answer(synonym) for synonym in synonyms) for synonyms in training_exact_answer]
+            generated_items = set(normalize_exact_answer(answer) for answer in exact_answer_items(generated_exact_answer))
+            generated_items.discard('')
+
+            correct_generated = sum(1 for answer in generated_items if any(answer in gold for gold in gold_items))
+            found_gold = sum(1 for gold in gold_items if gold & generated_items)
+            precision = correct_generated / len(generated_items) if generated_items else 0
+            recall = found_gold / len(gold_items) if gold_items else 0
+            f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0
+            list_precisions.append(precision)
+            list_recalls.append(recall)
+            list_f1s.append(f1)
+
+    return {
+        "yesno_accuracy": yesno_correct / yesno_total if yesno_total else 0,
+        "factoid_accuracy": factoid_correct / factoid_total if factoid_total else 0,
+        "list_precision": sum(list_precisions) / len(list_precisions) if list_precisions else 0,
+        "list_recall": sum(list_recalls) / len(list_recalls) if list_recalls else 0,
+        "list_f1": sum(list_f1s) / len(list_f1s) if list_f1s else 0,
+    }
@@ -0,0 +1,94 @@
+import functools
+import re
+import spacy
+
+SPACY_MODEL = "en_core_sci_lg"
+NLP_BATCH_SIZE = 256
+# Only the NER component (and the tok2vec it relies on) is needed for exact answers
+_UNUSED_COMPONENTS = ["tagger", "attribute_ruler", "lemmatizer", "parser"]
+
+# Positive/negative evidence for yes/no questions, matched in a single scan of each snippet. Words are
+# anchored at their start, so inflections ("shows", "confirmed") count but "improve"/"approve" do not,
+# and "disprove" counts only as negative evidence.
+_YESNO_RE = re.compile(
+    r'\b(?:(?P<positive>confirm|prov(?:e|en|ed|es|ing)\b|demonstrat|show|indicat)'
+    r'|(?P<negative>den(?:y|ies|ied)\b|refut|disprov|reject))',
+    re.IGNORECASE,
+)
+
+# Entity annotations keyed by text, shared across questions of a run
+_entity_cache = {}
+
+@functools.lru_cache(maxsize=None)
+def load_nlp():
+    """
+    Loads SpaCy's `en_core_sci_lg` model once, excluding the components unused by answer extraction
+    so that their weights are never loaded.
+    """
+    meta = spacy.util.get_model_meta(spacy.util.get_package_path(SPACY_MODEL))
+    components = meta.get("components", meta.get("pipeline", []))
+    return spacy.load(SPACY_MODEL, exclude=[name for name in _UNUSED_COMPONENTS if name in components])
+
+def annotate_texts(texts):
+    """
+    Returns the (text, label) entities of each text. Texts not seen before are annotated together
+    in one `nlp.pipe` pass and cached.
+    """
+    pending = list(dict.fromkeys(text for text in texts if text not in _entity_cache))
+    if pending:
+        nlp = load_nlp()
+        for text, doc in zip(pending, nlp.pipe(pending, batch_size=NLP_BATCH_SIZE)):
+            _entity_cache[text] = tuple((ent.text, ent.label_) for ent in doc.ents)
+    return [_entity_cache[text] for text in texts]
+
+def answer_yesno(snippets):
+    """
+    Classifies as 'yes' or 'no' based on the number of snippets with positive/negative indicators.
+    """
+    positive_indicators, negative_indicators = 0, 0
+    for snippet in snippets:
+        found = {match.lastgroup for match in _YESNO_RE.finditer(snippet)}
+        positive_indicators += 'positive' in found
+        negative_indicators += 'negative' in found
+    return 'yes' if positive_indicators > negative_indicators else 'no'
+
+def answer_from_entities(question_entities, snippet_entities, question_type):
+    """
+    Selects snippet entities whose labels match the entity labels found in the question.
+    List answers follow the dataset format, a list of single-item lists (e.g. [['item1'], ['item2']]).
+    """
+    question_labels = set(label for _, label in question_entities)
+    answers = [text for entities in snippet_entities for text, label in entities if label in question_labels]
+
+    if question_type == 'factoid':
+        return answers[0] if answers else "No exact answer found"
+    # List type
+    return [[answer] for answer in dict.fromkeys(answers)]
+
+def extract_exact_answers(questions):
+    """
+    Extracts exact answers for a batch of (question, snippets, question_type) tuples without an LLM.
+    All question and snippet texts of the batch are annotated in a single `nlp.pipe` pass.
+    """
+    entity_texts = []
+    for question, snippets, question_type in questions:
+        if question_type in ['factoid', 'list']:
+            entity_texts.append(question)
+            entity_texts.extend(snippets)
+    if entity_texts:
+        annotate_texts(entity_texts)
+
+    answers = []
+    for question, snippets, question_type in questions:
+        if question_type in ['yesno', 'yes_no']:
+            answers.append(answer_yesno(snippets))
+        elif question_type in ['factoid', 'list']:
+            question_entities = _entity_cache[question]
+            snippet_entities = [_entity_cache[snippet] for snippet in snippets]
+            answers.append(answer_from_entities(question_entities, snippet_entities, question_type))
+        else:
+            answers.append("Question requires detailed explanation")
+    return answers
+
+if __name__ == '__main__':
+    pass
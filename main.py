@@ -4,6 +4,7 @@ import search_utils
 import ranking_utils
 import openai_utils
 import evaluation_utils
+import exact_answer_utils
 from sentence_transformers import SentenceTransformer
 import json
 import re
@@ -17,6 +18,22 @@ def save_results(results, output_file="results.json"):
         json.dump({"questions": results}, f, indent=2)
 
 
+def evaluate_answer(result, ground_truth_ideal_answers):
+    """
+    Prints and evaluates a single generated answer against the ground truth ideal answer.
+    """
+    question_id = result["id"]
+    generated_answer = evaluation_utils.answer_to_text(result["generated_answer"])
+    print(f"Question: {result['question']}, Type: {result['type']}")
+    print(f"Generated Answer for Question {question_id}: {generated_answer}")
+
+    ground_truth_answer = ground_truth_ideal_answers.get(question_id, [""])[0]
+    rouge_score = evaluation_utils.compute_rouge_scores(ground_truth_answer, generated_answer)
+    bert_score = evaluation_utils.compute_bert_score_single(ground_truth_answer, generated_answer)
+    print(f"ROUGE Scores for Question {question_id}: {rouge_score}")
+    print(f"BERT Scores for Question {question_id}: {bert_score}")
+
+
 def run_baseline(file_path):
     """
     Runs the baseline pipeline for question answering.
@@ -78,6 +95,7 @@ def run_advanced(file_path):
     ground_truth_ideal_answers = evaluation_utils.load_training_ideal_answers(file_path)
     ground_truth_exact_answers = evaluation_utils.load_training_exact_answers(file_path)
     exact_results = []
+    pending_exact = []  # Questions answered by the local exact-answer engine after the loop
     num_qns = 0
     total_precision = 0
 
@@ -119,11 +137,14 @@ def run_advanced(file_path):
         snippet_list = ranking_utils.rank_snippet(top10_articles, question_body, model)
 
         # Step 5: Generate Ideal Answer using GPT
-        combined_snippets = query_handler_utils.prepare_snippets_for_gpt(snippet_list)
-        if question_type in ["factoid", "yesno", "list"]:
-            generated_answer = openai_utils.generate_exact_answer(question_body, combined_snippets, question_type)
+        if question_type in ["factoid", "yesno", "list"] and config.EXACT_ANSWER_ENGINE == "local":
+            generated_answer = None  # Extracted for all questions in one batch after the loop
         else:
-            generated_answer = openai_utils.generate_ideal_answer(question_body, combined_snippets)
+            packed_snippets = query_handler_utils.prepare_snippets_for_gpt(snippet_list, question_type)
+            if question_type in ["factoid", "yesno", "list"]:
+                generated_answer = openai_utils.generate_exact_answer(question_body, packed_snippets, question_type)
+            else:
+                generated_answer = openai_utils.generate_ideal_answer(question_body, packed_snippets, question_type)
 
         # Collect Results for Advanced Pipeline
         result = {
@@ -132,20 +153,26 @@ def run_advanced(file_path):
             "question": question["body"],
             "generated_answer": generated_answer
         }
-        print(f"Question: {question_body}, Type: {question_type}")
-        print(f"Generated Answer for Question {question_id}: {generated_answer}")
-
-        # Step 6: Evaluate Generated Answer
-        ground_truth_answer = ground_truth_ideal_answers.get(question_id, [""])[0]
-        rouge_score = evaluation_utils.compute_rouge_scores(ground_truth_answer, generated_answer)
-        bert_score = evaluation_utils.compute_bert_score_single(ground_truth_answer, generated_answer)
-        print(f"ROUGE Scores for Question {question_id}: {rouge_score}")
-        print(f"BERT Scores for Question {question_id}: {bert_score}")
+        if generated_answer is None:
+            # Evaluated in Step 7 once the batched extraction has filled in the answer
+            pending_exact.append((result, question_body, [snippet['text'] for snippet in snippet_list], question_type))
+        else:
+            # Step 6: Evaluate Generated Answer
+            evaluate_answer(result, ground_truth_ideal_answers)
 
         results.append(result)
         if question_type in ["factoid", "yesno", "list"]:
             exact_results.append(result)
 
+    # Step 7: Batched Local Exact Answer Extraction, then the per-question evaluation of Step 6
+    if pending_exact:
+        exact_answers = exact_answer_utils.extract_exact_answers(
+            [(question_body, snippets, question_type) for _, question_body, snippets, question_type in pending_exact]
+        )
+        for (result, *_), exact_answer in zip(pending_exact, exact_answers):
+            result["generated_answer"] = exact_answer
+            evaluate_answer(result, ground_truth_ideal_answers)
+
     # Save results for advanced pipeline
     save_results(results, output_file="advanced_results.json")
     phase_b_evaluation = evaluation_utils.evaluate_generated_ideal_answers(results, file_path)
@@ -153,7 +180,7 @@ def run_advanced(file_path):
     print(f"Phase B Evaluation: {phase_b_evaluation}")
 
     phase_b_exact_evaluation = evaluation_utils.evaluate_generated_exact_answers(exact_results, file_path)
-    print(f"Exact Answer Accuracy: {phase_b_exact_evaluation}")
+    print(f"Exact Answer Evaluation: {phase_b_exact_evaluation}")
 
 
 if __name__ == "__main__":
@@ -1,7 +1,7 @@
 from openai import OpenAI, RateLimitError, APIError, Timeout
 import config
 import time
-import tiktoken
+import prompt_utils
 import random
 import logging
 
@@ -15,24 +15,13 @@ client = OpenAI(
     api_key=config.OPENAI_API_KEY,
     )
 
-def truncate_text(text, max_tokens, encoding_name='gpt-3.5-turbo'):
-    encoding = tiktoken.encoding_for_model(encoding_name)
-    tokens = encoding.encode(text)
-    if len(tokens) > max_tokens:
-        tokens = tokens[:max_tokens]
-        text = encoding.decode(tokens)
-    return text
-
-def generate_ideal_answer(question_body, snippets):
-    max_prompt_tokens = 3500 #Adjust based on model's max context length, 4096 tokens for GPT-3.5-turbo
-
-    # Truncate snippets to prevent exceeding token limits
-    snippets_text = '\n'.join(snippets)
-    snippets_text = truncate_text(snippets_text,max_prompt_tokens)
+def generate_ideal_answer(question_body, packed_snippets, question_type="summary"):
+    # Snippets arrive already packed into the token budget of the question type, with their token count
+    snippets_text, snippet_tokens = packed_snippets
 
     prompt = (
         f"Question: {question_body}\n"
-        f"Relevant snippets:\n{snippets}\n"
+        f"Relevant snippets:\n{snippets_text}\n"
         "Please provide a concise and comprehensive answer to the question based on these snippets."
     )
 
@@ -42,16 +31,19 @@ def generate_ideal_answer(question_body, snippets):
         "Cite relevant findings where appropriate."
     )
 
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": prompt}
+    ]
+    prompt_tokens = prompt_utils.count_prompt_tokens(messages)
+    logger.info(f"Prompt tokens for {question_type} ideal answer: {prompt_tokens} ({snippet_tokens} from snippets)")
     
     for attempt in range(3):  # Retry up to 3 times
         try:
             # Use client to call ChatCompletion with gpt-3.5-turbo model
             response = client.chat.completions.create(
                 model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=messages,
                 max_tokens=config.GPT_MAX_TOKENS,
                 temperature=config.GPT_TEMPERATURE
             )
@@ -71,8 +63,10 @@ def generate_ideal_answer(question_body, snippets):
     # If all attempts fail, raise an exception
     raise Exception("Failed to generate answer after multiple attempts due to API errors.")
 
-def generate_exact_answer(question, snippets, question_type):
-    
+def generate_exact_answer(question, packed_snippets, question_type):
+    # Snippets arrive already packed into the token budget of the question type, with their token count
+    snippets_text, snippet_tokens = packed_snippets
+
     system_prompt = (
         "You are a specialized biomedical question answering system. "
         "For factoid questions, provide only the specific entity or value asked for. "
@@ -84,17 +78,21 @@ def generate_exact_answer(question, snippets, question_type):
     prompt = (
         f"Question Type: {question_type}\n"
         f"Question: {question}\n"
-        f"Relevant snippets:\n{snippets}\n"
+        f"Relevant snippets:\n{snippets_text}\n"
         "Provide the exact answer based on the question type and evidence."
     )
+
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": prompt}
+    ]
+    prompt_tokens = prompt_utils.count_prompt_tokens(messages)
+    logger.info(f"Prompt tokens for {question_type} exact answer: {prompt_tokens} ({snippet_tokens} from snippets)")
     
     try:
         response = client.chat.completions.create(
             model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt}
-            ],
+            messages=messages,
             max_tokens=config.GPT_MAX_TOKENS,
             temperature=config.GPT_TEMPERATURE
         )
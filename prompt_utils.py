@@ -0,0 +1,74 @@
+import functools
+import tiktoken
+
+DEFAULT_MODEL = 'gpt-3.5-turbo'
+SNIPPET_SEPARATOR = '\n'
+# Chat formatting overhead: tokens around each message and priming of the assistant reply
+TOKENS_PER_MESSAGE = 3
+REPLY_PRIMING_TOKENS = 3
+
+@functools.lru_cache(maxsize=None)
+def get_encoding(model=DEFAULT_MODEL):
+    """
+    Returns the tiktoken encoder for a model, loading it only once per process.
+    """
+    return tiktoken.encoding_for_model(model)
+
+@functools.lru_cache(maxsize=65536)
+def count_tokens(text, model=DEFAULT_MODEL):
+    """
+    Counts the tokens in a piece of text. Counts are cached so each snippet is tokenized a single time.
+    """
+    return len(get_encoding(model).encode(text))
+
+def count_prompt_tokens(messages, model=DEFAULT_MODEL):
+    """
+    Counts the prompt tokens of a chat request, including the per-message formatting overhead.
+    The system prompt and role names are cached, so each request only encodes its user prompt once.
+    """
+    num_tokens = REPLY_PRIMING_TOKENS
+    for message in messages:
+        num_tokens += TOKENS_PER_MESSAGE + count_tokens(message["role"], model)
+        if message["role"] == "system":
+            num_tokens += count_tokens(message["content"], model)
+        else:
+            num_tokens += len(get_encoding(model).encode(message["content"]))
+    return num_tokens
+
+def pack_snippets(snippets, max_tokens, model=DEFAULT_MODEL):
+    """
+    Greedily packs whole snippets, in ranked order, into a token budget. Duplicate snippets are skipped
+    and a snippet that does not fit is dropped rather than cut mid-sentence.
+    Returns the packed text and the number of tokens it uses.
+    """
+    separator_tokens = count_tokens(SNIPPET_SEPARATOR, model)
+    seen = set()
+    packed = []
+    used_tokens = 0
+
+    for snippet in snippets:
+        key = ' '.join(snippet.lower().split())
+        if not key or key in seen:
+            continue
+        cost = count_tokens(snippet, model) + (separator_tokens if packed else 0)
+        if used_tokens + cost > max_tokens:
+            continue
+        seen.add(key)
+        packed.append(snippet)
+        used_tokens += cost
+
+    return SNIPPET_SEPARATOR.join(packed), used_tokens
+
+if __name__ == '__main__':
+    import config
+
+    # Budget check: ranked sentence snippets must not all fit in the smaller budgets
+    snippets = [
+        f"Sentence {i} reports that the expression of gene {i} was significantly increased in patients with the disease."
+        for i in range(30)
+    ]
+    for question_type, budget in config.PROMPT_TOKEN_BUDGETS.items():
+        packed_text, used_tokens = pack_snippets(snippets, budget)
+        packed_count = len(packed_text.split(SNIPPET_SEPARATOR))
+        assert used_tokens <= budget and packed_count < len(snippets), (question_type, used_tokens, packed_count)
+        print(f"{question_type}: packed {packed_count} of {len(snippets)} snippets in {used_tokens}/{budget} tokens")
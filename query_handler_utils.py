@@ -1,4 +1,5 @@
 import json
+import re
 import spacy
 from transformers import AutoModelForTokenClassification, AutoTokenizer, AutoModel
 from transformers import pipeline
@@ -6,6 +7,8 @@ from sklearn.feature_extraction.text import CountVectorizer
 import torch
 from openai import OpenAI
 import config
+import prompt_utils
+import exact_answer_utils
 
 def parse_json(file_path):
     """
@@ -98,41 +101,17 @@ def identify_question_type(question):
 def extract_exact_answer(question, snippets, question_type):
     """
     Extracts an exact answer from snippets based on the question type.
+    For many questions, prefer `exact_answer_utils.extract_exact_answers`, which batches the NLP pass.
     """
-    nlp = spacy.load("en_core_sci_lg")
+    return exact_answer_utils.extract_exact_answers([(question, snippets, question_type)])[0]
 
-    if question_type == 'yes_no':
-        # Classify as 'Yes' or 'No' based on positive/negative indicators in the snippets
-        positive_indicators = sum(1 for s in snippets if any(pos in s.lower()
-                                                             for pos in ['confirm', 'prove', 'demonstrate', 'show', 'indicate']))
-        negative_indicators = sum(1 for s in snippets if any(neg in s.lower()
-                                                             for neg in ['deny', 'refute', 'disprove', 'reject']))
-        return 'Yes' if positive_indicators > negative_indicators else 'No'
-
-    elif question_type in ['factoid', 'list']:
-        # Extract named entities from the snippets that match question focus
-        question_doc = nlp(question)
-        question_entities = set(ent.label_ for ent in question_doc.ents)
-
-        answers = []
-        for snippet in snippets:
-            doc = nlp(snippet)
-            for ent in doc.ents:
-                if ent.label_ in question_entities:
-                    answers.append(ent.text)
-
-        if question_type == 'factoid':
-            return answers[0] if answers else "No exact answer found"
-        else:  # List type
-            return "; ".join(set(answers)) if answers else "No exact answers found"
-
-    return "Question requires detailed explanation"
-
-def prepare_snippets_for_gpt(snippets):
+def prepare_snippets_for_gpt(snippets, question_type="summary"):
     """
-    Combines the top 5 snippets into a single string for use with GPT.
+    Packs the highest-ranked, de-duplicated snippets into the token budget for the question type.
+    Returns the combined snippet text for use with GPT and the number of tokens it uses.
     """
-    return " ".join([snippet['text'] for snippet in snippets[:5]])
+    budget = config.PROMPT_TOKEN_BUDGETS.get(question_type, config.PROMPT_TOKEN_BUDGETS["summary"])
+    return prompt_utils.pack_snippets([snippet['text'] for snippet in snippets], budget)
 
 if __name__ == '__main__':
     pass
\ No newline at end of file
@@ -1,5 +1,6 @@
 from sentence_transformers import SentenceTransformer, util
 import torch
+import segmentation_utils
 
 def rank_abstract(article_info_list, question_body, model):
     """
@@ -18,49 +19,37 @@ def rank_abstract(article_info_list, question_body, model):
     sorted_articles = [article_info_list[i] for i in sorted_indices]
     return sorted_articles
 
-def find_snippet_location(article, snippet_str):
-    """
-    Identifies the location of a snippet within an article (abstract or title).
-    """
-    snip_length = len(snippet_str)
-    start_ind = article['abstract'].find(snippet_str)
-    if start_ind != -1:  # Snippet found in abstract
-        return 'abstract', start_ind, start_ind + snip_length
-            
-    start_ind = article['title'].find(snippet_str)
-    if start_ind != -1:  # Snippet found in title
-        return 'title', start_ind, start_ind + snip_length
-
-def rank_snippet(top10_articles, question_body, model):
+def rank_snippet(top10_articles, question_body, model, sentences_per_article=3):
     """
     Ranks snippets from the top 10 articles based on their semantic similarity to the question.
+    Keeps the top `sentences_per_article` sentences of each article and orders all of them by score.
     """
     snippet_list = []
+    query_embedding = model.encode(question_body, normalize_embeddings=True)
     for article in top10_articles:
         if article['abstract']:
-            abstract = article['abstract']
-            abstract_sentences = abstract.split('. ')
+            sentences = segmentation_utils.get_article_sentences(article)
+            candidate_sentences = sentences.texts()
 
-            if article['title']:
-                abstract_sentences.append(article['title'])
-
-            query_embedding = model.encode(question_body, normalize_embeddings=True)
-            corpus_embeddings = model.encode(abstract_sentences, normalize_embeddings=True)
+            corpus_embeddings = model.encode(candidate_sentences, normalize_embeddings=True)
             dot_scores = util.dot_score(query_embedding, corpus_embeddings)[0]
-            top_results = torch.topk(dot_scores, k=min(3, len(dot_scores)))  # Get up to 3 sentences
-            if top_results.indices.size(0) > 0:  # Ensure there are valid results
-                snippet_str = abstract_sentences[top_results.indices[0]]  # Get the most similar sentence/snippet
-                # Continue processing the snippet
-                section, start, end = find_snippet_location(article, snippet_str)
+            top_results = torch.topk(dot_scores, k=min(sentences_per_article, len(dot_scores)))
+            for score, index in zip(top_results.values.tolist(), top_results.indices.tolist()):
+                # Offsets come straight from the precomputed segmentation
+                section, start, end = sentences.span(index)
                 snip = {
                     'pmid': article['pmid'],
                     'offsetInBeginSection': start,
                     'offsetInEndSection': end,
                     'beginSection': section,
                     'endSection': section,
-                    'text': snippet_str
+                    'text': candidate_sentences[index],
+                    'score': score
                  }
                 snippet_list.append(snip)
+
+    # Order the snippets of all articles by decreasing similarity to the question
+    snippet_list.sort(key=lambda snip: snip['score'], reverse=True)
     return snippet_list
 
 def select_snippets_baseline(abstracts, question_keywords):
@@ -69,7 +58,7 @@ def select_snippets_baseline(abstracts, question_keywords):
     """
     snippets = []
     for article in abstracts:
-        sentences = article['abstract'].split('. ')
+        sentences = segmentation_utils.get_article_sentences(article).texts('abstract')
         sentence_scores = []
         for sentence in sentences:
             score = sum(1 for word in question_keywords if word in sentence.lower())
@@ -1,5 +1,6 @@
 import requests
 import xml.etree.ElementTree as ET
+import segmentation_utils
 
 def construct_query_baseline(keywords):
     """
@@ -42,6 +43,7 @@ def ncbi_query(ncbi_retmax, query_term, min_date, max_date):
 def ncbi_title_abstract_query(pmid_list):
     """
     Fetches article details (PMID, title, abstract) from PubMed based on a list of PMIDs.
+    Each article's sentences are segmented once here and stored under the 'sentences' key.
     """
     efetch_url = f"https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi?db=pubmed&id={','.join(pmid_list)}&retmode=xml"
 
@@ -79,6 +81,7 @@ def ncbi_title_abstract_query(pmid_list):
                                 abstract_full_text += ele_next
 
             item['abstract'] = abstract_full_text
+            item['sentences'] = segmentation_utils.segment_article(item)
             result.append(item)
     else:
         print(f"Unsuccessful for {pmid_list}. Status code: {response.status_code}")